@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+import numpy as np
 
 # Parameters for ASDM
 ALPHA = 0.05      # Job automation rate
@@ -10,68 +11,24 @@ INITIAL_JOBS = 1000  # Initial employed workers
 INITIAL_WAGE = 100   # Wage per worker
 AI_PROFIT_PER_JOB = 50  # Profit per automated job
 NUM_STEPS = 50     # Simulation steps
-
-
-class Worker:
-    """Worker consuming based on employment status."""
-    def __init__(self, wage=INITIAL_WAGE):
-        self.employed = True
-        self.wage = wage
-        self.consumption = self.wage * BETA if self.employed else 0
-
-    def update(self):
-        """Update consumption (C_t = β * W_t if employed)."""
-        self.consumption = self.wage * BETA if self.employed else 0
-
-
-class AIFirm:
-    """AI firm automating jobs, risking economic disruption."""
-    def __init__(self):
-        self.material_gain = 0  # Profit (chess material gain)
-
-    def update(self, num_employed, total_consumption, initial_consumption):
-        """Automate jobs (L_t+1 = L_t - α S_t), adjust profit."""
-        jobs_to_automate = int(ALPHA * num_employed)
-        raw_profit = jobs_to_automate * AI_PROFIT_PER_JOB
-        ratio = (total_consumption / initial_consumption
-                 if initial_consumption > 0 else 0)
-        self.material_gain += raw_profit * max(0, 1 - EPSILON * (1 - ratio))
-        return jobs_to_automate
-
-
-class NonAIFirm:
-    """Non-AI firm with revenue tied to demand."""
-    def __init__(self):
-        self.revenue = 0
-
-    def update(self, total_consumption):
-        """Update revenue (R_t+1 = R_t - γ ΔC_t)."""
-        self.revenue = GAMMA * total_consumption
-
-
-class Government:
-    """Government taxing and spending to support demand."""
-    def __init__(self):
-        self.tax_revenue = 0
-
-    def update(self, num_employed, non_ai_firms):
-        """Collect taxes, boost consumption (T_t+1 = τ R_t)."""
-        wages = num_employed * INITIAL_WAGE
-        firm_revenue = sum(f.revenue for f in non_ai_firms)
-        self.tax_revenue = TAU * (wages + firm_revenue)
-        return 0.5 * self.tax_revenue  # Stimulus effect
+NUM_NONAI = 5      # Number of non-AI firms
 
 
 class Economy:
     """Economy simulating AI self-disruption feedback loop."""
     def __init__(self):
         self.num_employed = INITIAL_JOBS
-        self.workers = [Worker() for _ in range(INITIAL_JOBS)]
-        self.ai_firm = AIFirm()
-        self.non_ai_firms = [NonAIFirm() for _ in range(5)]
-        self.government = Government()
+        self.wages = np.full(INITIAL_JOBS, INITIAL_WAGE, dtype=np.float32)
+        self.employed = np.ones(INITIAL_JOBS, dtype=bool)
+        self.consumption = BETA * self.wages
+        self.material_gain = 0  # AI profit (chess material gain)
+        self.nonai_revenue = 0
+        self.tax_revenue = 0
         self.total_consumption = INITIAL_JOBS * INITIAL_WAGE * BETA
         self.initial_consumption = self.total_consumption
+        self.inv_initial_consumption = (1.0 / self.initial_consumption
+                                        if self.initial_consumption > 0
+                                        else 0.0)
         self.data = {
             "Employment": [self.num_employed],
             "Consumption": [self.total_consumption],
@@ -82,36 +39,35 @@ class Economy:
 
     def step(self):
         """Advance one step, updating state and collecting data."""
-        # Update workers' consumption
-        for worker in self.workers:
-            worker.update()
-        self.total_consumption = sum(w.consumption for w in self.workers)
+        # Update workers' consumption (C_t = β * W_t if employed)
+        np.multiply(self.wages, BETA, out=self.consumption)
+        self.consumption[~self.employed] = 0.0
+        self.total_consumption = self.consumption.sum(dtype=np.float64)
+
+        # AI firm automates jobs (L_t+1 = L_t - α S_t), adjusts profit
+        jobs_to_automate = int(ALPHA * self.num_employed)
+        raw_profit = jobs_to_automate * AI_PROFIT_PER_JOB
+        ratio = self.total_consumption * self.inv_initial_consumption
+        self.material_gain += raw_profit * max(0, 1 - EPSILON * (1 - ratio))
 
-        # AI firm automates jobs
-        jobs_to_automate = self.ai_firm.update(
-            self.num_employed, self.total_consumption, self.initial_consumption
-        )
-        for i, worker in enumerate(self.workers):
-            if i < jobs_to_automate and worker.employed:
-                worker.employed = False
-        self.num_employed = sum(1 for w in self.workers if w.employed)
+        self.employed[:jobs_to_automate] = False
+        self.num_employed = int(np.count_nonzero(self.employed))
 
-        # Update non-AI firms
-        for firm in self.non_ai_firms:
-            firm.update(self.total_consumption)
+        # Update non-AI firms (R_t+1 = R_t - γ ΔC_t)
+        self.nonai_revenue = GAMMA * self.total_consumption
+        total_nonai = NUM_NONAI * self.nonai_revenue
 
-        # Government taxes and spends
-        stimulus = self.government.update(self.num_employed, self.non_ai_firms)
-        self.total_consumption += stimulus
+        # Government taxes (T_t+1 = τ R_t) and spends half as stimulus
+        wages = self.num_employed * INITIAL_WAGE
+        self.tax_revenue = TAU * (wages + total_nonai)
+        self.total_consumption += 0.5 * self.tax_revenue
 
         # Collect data
         self.data["Employment"].append(self.num_employed)
         self.data["Consumption"].append(self.total_consumption)
-        self.data["Tax Revenue"].append(self.government.tax_revenue)
-        self.data["AI Profit"].append(self.ai_firm.material_gain)
-        self.data["Non-AI Revenue"].append(
-            sum(f.revenue for f in self.non_ai_firms)
-        )
+        self.data["Tax Revenue"].append(self.tax_revenue)
+        self.data["AI Profit"].append(self.material_gain)
+        self.data["Non-AI Revenue"].append(total_nonai)
 
 
 # Run simulation
@@ -121,9 +77,9 @@ if __name__ == "__main__":
         economy.step()
 
     # Normalize data for plotting
-    data = economy.data
-    normalized = {key: [v / max(values) for v in values]
-                  for key, values in data.items()}
+    data = {key: np.asarray(values) for key, values in economy.data.items()}
+    normalized = {key: v / v.max() if v.max() > 0 else np.zeros_like(v)
+                  for key, v in data.items()}
 
     # Plot results
     plt.figure(figsize=(10, 6))
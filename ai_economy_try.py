@@ -10,6 +10,7 @@ BETA, GAMMA, TAU, EPSILON = 0.8, 0.7, 0.3, 0.5
 INITIAL_WAGE_MEAN, INITIAL_WAGE_STD = 100, 10
 AI_PROFIT_PER_JOB = 50
 NUM_STEPS = 50
+NUM_NONAI = 5
 
 
 class Worker:
@@ -40,21 +41,13 @@ class AIFirm:
         return jobs_to_automate
 
 
-class NonAIFirm:
-    def __init__(self):
-        self.revenue = 0
-
-    def update(self, total_consumption):
-        self.revenue = GAMMA * total_consumption
-
-
 class Government:
     def __init__(self):
         self.tax_revenue = 0
 
-    def update(self, workers, firms):
+    def update(self, workers, total_consumption):
         wages = sum(w.wage for w in workers if w.employed)
-        revenue = sum(f.revenue for f in firms)
+        revenue = NUM_NONAI * GAMMA * total_consumption
         self.tax_revenue = TAU * (wages + revenue)
         return 0.5 * self.tax_revenue
 
@@ -72,7 +65,6 @@ class Economy:
         )
         self.workers = [Worker(w) for w in wages]
         self.ai_firm = AIFirm()
-        self.non_ai_firms = [NonAIFirm() for _ in range(5)]
         self.government = Government()
         self.initial_consumption = sum(w.consumption for w in self.workers)
         self.total_consumption = self.initial_consumption
@@ -97,10 +89,10 @@ class Economy:
         for idx in employed_indices[:jobs_to_automate]:
             self.workers[idx].employed = False
 
-        for f in self.non_ai_firms:
-            f.update(self.total_consumption)
-
-        stimulus = self.government.update(self.workers, self.non_ai_firms)
+        stimulus = self.government.update(
+            self.workers,
+            self.total_consumption
+        )
         self.total_consumption += stimulus
 
         self.history.append({
@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import numpy as np
+from numba import njit
 
 
 # === PARAMETERS === #
@@ -11,108 +12,142 @@ BETA, GAMMA, TAU, EPSILON = 0.8, 0.7, 0.3, 0.5
 INITIAL_WAGE_MEAN, INITIAL_WAGE_STD = 100, 10
 AI_PROFIT_PER_JOB = 50
 NUM_STEPS = 50
-
-
-class Worker:
-    def __init__(self, wage):
-        self.wage = wage
-        self.employed = True
-        self.consumption = BETA * wage
-
-    def update(self):
-        self.consumption = BETA * self.wage if self.employed else 0
-
-
-class AIFirm:
-    def __init__(self):
-        self.material_gain = 0
-
-    def update(self, num_employed, total_consumption, initial_consumption):
-        alpha = max(0, np.random.normal(ALPHA_MEAN, ALPHA_STD))
-        jobs_to_automate = int(alpha * num_employed)
-        raw_profit = jobs_to_automate * AI_PROFIT_PER_JOB
-        ratio = (
-            total_consumption / initial_consumption
-            if initial_consumption > 0
-            else 0
-        )
-        adjusted_profit = raw_profit * max(0, 1 - EPSILON * (1 - ratio))
-        self.material_gain += adjusted_profit
-        return jobs_to_automate
-
-
-class NonAIFirm:
-    def __init__(self):
-        self.revenue = 0
-
-    def update(self, total_consumption):
-        self.revenue = GAMMA * total_consumption
-
-
-class Government:
-    def __init__(self):
-        self.tax_revenue = 0
-
-    def update(self, workers, firms):
-        wages = sum(w.wage for w in workers if w.employed)
-        revenue = sum(f.revenue for f in firms)
-        self.tax_revenue = TAU * (wages + revenue)
-        return 0.5 * self.tax_revenue
+NUM_NONAI = 5
+HISTORY_SHAPE = (NUM_STEPS, GRID_ROWS, GRID_COLS)
+WAGE_MAX = 150  # Top of the heatmap wage scale
+
+
+@njit(cache=True, fastmath=True)
+def step_kernel(wages, employed, consumption, inv_initial_consumption,
+                material_gain, rng):
+    """Advance the economy one step in place on the worker arrays.
+
+    The worker arrays must hold exactly NUM_WORKERS entries. Returns the
+    new total consumption, AI profit, per-firm non-AI revenue and tax
+    revenue.
+    """
+    if (wages.size != NUM_WORKERS or employed.size != NUM_WORKERS
+            or consumption.size != NUM_WORKERS):
+        raise ValueError("worker arrays must have NUM_WORKERS entries")
+
+    # Loop bounds are the NUM_WORKERS global, which Numba freezes as a
+    # compile-time constant; branch-free bodies let the loops vectorize
+    total_consumption = 0.0
+    num_employed = 0
+    for i in range(NUM_WORKERS):
+        consumption[i] = BETA * wages[i] * employed[i]
+        total_consumption += consumption[i]
+        num_employed += employed[i]
+
+    alpha = max(0.0, rng.normal(ALPHA_MEAN, ALPHA_STD))
+    jobs_to_automate = int(alpha * num_employed)
+    raw_profit = jobs_to_automate * AI_PROFIT_PER_JOB
+    ratio = total_consumption * inv_initial_consumption
+    material_gain += raw_profit * max(0.0, 1 - EPSILON * (1 - ratio))
+
+    # Partial Fisher-Yates over the employed indices picks k at random
+    employed_indices = np.flatnonzero(employed)
+    n = employed_indices.size
+    for j in range(min(jobs_to_automate, n)):
+        r = rng.integers(j, n)
+        idx = employed_indices[r]
+        employed_indices[r] = employed_indices[j]
+        employed[idx] = False
+
+    nonai_revenue = GAMMA * total_consumption
+    wages_employed = 0.0
+    for i in range(NUM_WORKERS):
+        wages_employed += wages[i] * employed[i]
+    tax_revenue = TAU * (wages_employed + NUM_NONAI * nonai_revenue)
+    total_consumption += 0.5 * tax_revenue
+    return total_consumption, material_gain, nonai_revenue, tax_revenue
 
 
 class Economy:
-    def __init__(self):
+    def __init__(self, seed=None, history_path=None):
+        self.rng = np.random.default_rng(seed)
         wages = np.clip(
-            np.random.normal(INITIAL_WAGE_MEAN, INITIAL_WAGE_STD, NUM_WORKERS),
+            self.rng.normal(INITIAL_WAGE_MEAN, INITIAL_WAGE_STD, NUM_WORKERS),
             10,
             None
         )
-        self.workers = [Worker(w) for w in wages]
-        self.ai_firm = AIFirm()
-        self.non_ai_firms = [NonAIFirm() for _ in range(5)]
-        self.government = Government()
-        self.initial_consumption = sum(w.consumption for w in self.workers)
+        self.wages = wages.astype(np.float32)
+        self.employed = np.ones(NUM_WORKERS, dtype=bool)
+        self.consumption = BETA * self.wages
+        self.material_gain = 0.0
+        self.nonai_revenue = 0.0
+        self.tax_revenue = 0.0
+        self.initial_consumption = self.consumption.sum(dtype=np.float64)
         self.total_consumption = self.initial_consumption
-        self.history = []
+        self.inv_initial_consumption = (
+            1.0 / self.initial_consumption
+            if self.initial_consumption > 0
+            else 0.0
+        )
 
-    def step(self):
-        for w in self.workers:
-            w.update()
-        self.total_consumption = sum(w.consumption for w in self.workers)
+        # Preallocated per-step history, wage grid optionally file-backed
+        self.t = 0
+        if history_path is None:
+            self.hist_wages = np.empty(HISTORY_SHAPE, dtype=np.float32)
+        else:
+            self.hist_wages = np.memmap(
+                history_path,
+                dtype=np.float32,
+                mode='w+',
+                shape=HISTORY_SHAPE
+            )
+        self.hist_emp = np.empty((NUM_STEPS, NUM_WORKERS), dtype=bool)
+        self.hist_ai_profit = np.empty(NUM_STEPS)
+        self.hist_tax_revenue = np.empty(NUM_STEPS)
+        self.hist_consumption = np.empty(NUM_STEPS)
 
-        num_employed = sum(w.employed for w in self.workers)
-        jobs_to_automate = self.ai_firm.update(
-            num_employed,
+    def step(self):
+        if self.t >= NUM_STEPS:
+            raise RuntimeError(
+                f"history is preallocated for NUM_STEPS={NUM_STEPS} steps"
+            )
+        (
             self.total_consumption,
-            self.initial_consumption
+            self.material_gain,
+            self.nonai_revenue,
+            self.tax_revenue
+        ) = step_kernel(
+            self.wages,
+            self.employed,
+            self.consumption,
+            self.inv_initial_consumption,
+            self.material_gain,
+            self.rng
         )
 
-        employed_indices = [
-            i for i, w in enumerate(self.workers) if w.employed
-        ]
-        np.random.shuffle(employed_indices)
-        for idx in employed_indices[:jobs_to_automate]:
-            self.workers[idx].employed = False
-
-        for f in self.non_ai_firms:
-            f.update(self.total_consumption)
+        t = self.t
+        self.hist_emp[t] = self.employed
+        # Multiply grid views of the worker arrays straight into the slab
+        np.multiply(
+            self.wages.reshape((GRID_ROWS, GRID_COLS)),
+            self.employed.reshape((GRID_ROWS, GRID_COLS)),
+            out=self.hist_wages[t]
+        )
+        self.hist_ai_profit[t] = self.material_gain
+        self.hist_tax_revenue[t] = self.tax_revenue
+        self.hist_consumption[t] = self.total_consumption
+        self.t += 1
 
-        stimulus = self.government.update(self.workers, self.non_ai_firms)
-        self.total_consumption += stimulus
 
-        self.history.append({
-            "employment": [w.employed for w in self.workers],
-            "wages": [w.wage if w.employed else 0 for w in self.workers],
-            "ai_profit": self.ai_firm.material_gain,
-            "tax_revenue": self.government.tax_revenue,
-            "consumption": self.total_consumption
-        })
+def load_wage_history(path):
+    """Open a wage history written via Economy(history_path=...) read-only."""
+    return np.memmap(path, dtype=np.float32, mode='r', shape=HISTORY_SHAPE)
 
 
-def animate_economy():
-    economy = Economy()
+def animate_economy(history_path=None):
+    economy = Economy(history_path=history_path)
     for _ in range(NUM_STEPS):
         economy.step()
+    if history_path is not None:
+        economy.hist_wages.flush()
+        wage_history = load_wage_history(history_path)
+    else:
+        wage_history = economy.hist_wages
 
     # Create figure with adjusted layout
     fig = plt.figure(figsize=(14, 8))
@@ -121,7 +156,7 @@ def animate_economy():
     # Main plot for chessboard
     ax1 = fig.add_subplot(gs[0])
     ax1.axis("off")
-    title = ax1.set_title(
+    ax1.set_title(
         "AI Economic Disruption Simulation",
         fontsize=16,
         pad=20
@@ -131,13 +166,20 @@ def animate_economy():
     chess_pattern = np.indices((GRID_ROWS, GRID_COLS)).sum(axis=0) % 2
     ax1.imshow(chess_pattern, cmap='binary', alpha=0.1)
 
+    # Wage frames are quantized to uint8 colormap levels one at a time into
+    # reused buffers, so a file-backed history is never loaded whole
+    wage_scale = np.float32(255 / WAGE_MAX)
+    scaled = np.empty((GRID_ROWS, GRID_COLS), dtype=np.float32)
+    levels = np.empty((GRID_ROWS, GRID_COLS), dtype=np.uint8)
+
     # Initialize heatmap for wages
     im = ax1.imshow(
-        np.zeros((GRID_ROWS, GRID_COLS)),
+        np.zeros((GRID_ROWS, GRID_COLS), dtype=np.uint8),
         cmap='RdYlGn',
         vmin=0,
-        vmax=150,
-        alpha=0.8  # Slightly transparent to see chessboard
+        vmax=255,
+        alpha=0.8,  # Slightly transparent to see chessboard
+        animated=True
     )
 
     # Add grid lines
@@ -156,7 +198,8 @@ def animate_economy():
         transform=ax2.transAxes,
         fontsize=12,
         va='center',
-        bbox=dict(facecolor='white', alpha=0.7, boxstyle='round')
+        bbox=dict(facecolor='white', alpha=0.7, boxstyle='round'),
+        animated=True
     )
 
     # Add colorbar below chessboard with adjusted position
@@ -164,36 +207,42 @@ def animate_economy():
         [0.15, 0.05, 0.3, 0.03]
     )  # [left, bottom, width, height]
     cbar = fig.colorbar(im, cax=cax, orientation='horizontal')
+    wage_ticks = np.arange(0, WAGE_MAX + 1, 20)
+    cbar.set_ticks(wage_ticks * wage_scale, labels=wage_ticks)
     cbar.set_label('Wage Levels ($)', fontsize=10)
 
     def update(frame):
-        data = economy.history[frame]
-        grid = np.array(data["wages"]).reshape((GRID_ROWS, GRID_COLS))
-        im.set_array(grid)
-        title.set_text(f"Step {frame + 1}/{NUM_STEPS}")
-
-        # Format metrics with larger font for key numbers
-        employed_pct = np.mean(data["employment"]) * 100
+        np.multiply(wage_history[frame], wage_scale, out=scaled)
+        np.clip(scaled, 0, 255, out=scaled)
+        levels[...] = scaled
+        im.set_array(levels)
+
+        # Step counter lives in the metrics panel: blitting only redraws
+        # inside each Axes' bbox, which excludes the title
+        employed_pct = economy.hist_emp[frame].mean() * 100
         info = (
+            f"Step {frame + 1}/{NUM_STEPS}\n\n"
             "Economic Metrics:\n\n"
             f"Employment:  {employed_pct:.1f}%\n"
-            f"AI Profit:   ${data['ai_profit']:,.0f}\n"
-            f"Tax Revenue: ${data['tax_revenue']:,.0f}\n"
-            f"Consumption: ${data['consumption']:,.0f}"
+            f"AI Profit:   ${economy.hist_ai_profit[frame]:,.0f}\n"
+            f"Tax Revenue: ${economy.hist_tax_revenue[frame]:,.0f}\n"
+            f"Consumption: ${economy.hist_consumption[frame]:,.0f}"
         )
         metrics_text.set_text(info)
 
-        return [im, title, metrics_text]
+        return [im, metrics_text]
 
     ani = animation.FuncAnimation(
         fig,
         update,
         frames=NUM_STEPS,
         interval=300,
-        repeat=False
+        repeat=False,
+        blit=True
     )
 
-    ani.save("ai_disruption_chessboard.gif", writer='pillow', fps=2, dpi=100)
+    writer = animation.PillowWriter(fps=2)
+    ani.save("ai_disruption_chessboard.gif", writer=writer, dpi=80)
     plt.show()
 
 
@@ -1,5 +1,8 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import matplotlib.pyplot as plt
 import numpy as np
+from numba import njit
 
 
 # Parameters for ASDM (can be adjusted)
@@ -14,109 +17,48 @@ INITIAL_WAGE_MEAN = 100  # Average wage per worker
 INITIAL_WAGE_STD = 10    # Wage heterogeneity (std dev)
 AI_PROFIT_PER_JOB = 50   # Profit per automated job
 NUM_STEPS = 50           # Simulation steps
+NUM_NONAI = 5            # Number of (identical) non-AI firms
 
-
-class Worker:
-    """Worker with heterogeneous wage and consumption based on employment."""
-    def __init__(self, wage):
-        self.employed = True
-        self.wage = wage
-        self.consumption = self.wage * BETA if self.employed else 0
-
-    def update(self):
-        """Update consumption (C_t = β * W_t if employed)."""
-        self.consumption = self.wage * BETA if self.employed else 0
-
-
-class AIFirm:
-    """
-    AI firm automating jobs and adjusting profits based on market conditions.
-    """
-    def __init__(self):
-        self.material_gain = 0  # Accumulated profit
-
-    def update(self, num_employed, total_consumption, initial_consumption):
-        """
-        Automate jobs with stochastic rate, calculate adjusted profit.
-
-        Returns:
-            int: Number of jobs automated this step
-        """
-        # Stochastic automation rate simulating shocks in tech adoption
-        alpha = max(0, np.random.normal(ALPHA_MEAN, ALPHA_STD))
-
-        jobs_to_automate = int(alpha * num_employed)
-        raw_profit = jobs_to_automate * AI_PROFIT_PER_JOB
-
-        # Market effect: profit adjusted by consumption ratio
-        ratio = (
-            total_consumption / initial_consumption
-            if initial_consumption > 0
-            else 0
-        )
-        profit_adjusted = raw_profit * max(0, 1 - EPSILON * (1 - ratio))
-
-        self.material_gain += profit_adjusted
-        return jobs_to_automate
-
-
-class NonAIFirm:
-    """Non-AI firm with revenue tied linearly to total consumption."""
-    def __init__(self):
-        self.revenue = 0
-
-    def update(self, total_consumption):
-        """Revenue proportional to total consumption (demand)."""
-        self.revenue = GAMMA * total_consumption
-
-
-class Government:
-    """Government collects taxes and provides stimulus to support demand."""
-    def __init__(self):
-        self.tax_revenue = 0
-
-    def update(self, num_employed, non_ai_firms, workers):
-        """
-        Tax wages and firm revenues, return stimulus (fraction of tax).
-
-        Args:
-            num_employed: Currently employed workers
-            non_ai_firms: List of NonAIFirm instances
-            workers: List of Worker instances
-
-        Returns:
-            float: Government stimulus amount
-        """
-        wages = sum(
-            worker.wage
-            for worker in workers
-            if worker.employed
-        )
-        firm_revenue = sum(f.revenue for f in non_ai_firms)
-        self.tax_revenue = TAU * (wages + firm_revenue)
-        return 0.5 * self.tax_revenue  # Government stimulus spending
+# Recorded series, in the order returned by run_kernel
+SERIES = (
+    "Employment",
+    "Consumption",
+    "Tax Revenue",
+    "AI Profit",
+    "Non-AI Revenue"
+)
 
 
 class Economy:
     """Economy simulating AI disruption with heterogeneity and shocks."""
-    def __init__(self):
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
         # Initialize workers with wage heterogeneity
-        wages = np.random.normal(
+        wages = self.rng.normal(
             INITIAL_WAGE_MEAN,
             INITIAL_WAGE_STD,
             INITIAL_JOBS
         )
         wages = np.clip(wages, a_min=10, a_max=None)  # No negative wages
 
-        self.workers = [Worker(wage=w) for w in wages]
+        # Workers stored column-wise: wage, employment and consumption
+        self.wages = wages.astype(np.float32)
+        self.employed = np.ones(INITIAL_JOBS, dtype=bool)
+        self.consumption = BETA * self.wages
         self.num_employed = INITIAL_JOBS
-        self.ai_firm = AIFirm()
-        self.non_ai_firms = [NonAIFirm() for _ in range(5)]
-        self.government = Government()
+        self.material_gain = 0   # AI firm accumulated profit
+        self.nonai_revenue = 0   # Revenue of each non-AI firm
+        self.tax_revenue = 0
 
         # Initial total consumption
-        self.total_consumption = sum(w.consumption for w in self.workers)
+        self.total_consumption = self.consumption.sum(dtype=np.float64)
         self.initial_consumption = self.total_consumption
+        self.inv_initial_consumption = (
+            1.0 / self.initial_consumption
+            if self.initial_consumption > 0
+            else 0.0
+        )
 
         # Store simulation data
         self.data = {
@@ -129,62 +71,242 @@ class Economy:
 
     def step(self):
         """Run one timestep of the economy simulation."""
-        # Update workers' consumption based on employment and wage
-        for worker in self.workers:
-            worker.update()
-        self.total_consumption = sum(w.consumption for w in self.workers)
-
-        # AI firm automates jobs
-        jobs_to_automate = self.ai_firm.update(
-            self.num_employed,
-            self.total_consumption,
-            self.initial_consumption
-        )
+        # Update workers' consumption (C_t = β * W_t if employed)
+        np.multiply(self.wages, BETA, out=self.consumption)
+        self.consumption[~self.employed] = 0.0
+        self.total_consumption = self.consumption.sum(dtype=np.float64)
+
+        # AI firm automates jobs with stochastic rate simulating shocks
+        # in tech adoption
+        alpha = max(0, self.rng.normal(ALPHA_MEAN, ALPHA_STD))
+        jobs_to_automate = int(alpha * self.num_employed)
+        raw_profit = jobs_to_automate * AI_PROFIT_PER_JOB
+
+        # Market effect: profit adjusted by consumption ratio
+        ratio = self.total_consumption * self.inv_initial_consumption
+        self.material_gain += raw_profit * max(0, 1 - EPSILON * (1 - ratio))
 
         # Automate jobs by setting workers to unemployed
-        employed_indices = [
-            i for i, w in enumerate(self.workers)
-            if w.employed
-        ]
+        employed_indices = np.flatnonzero(self.employed)
         to_automate_indices = employed_indices[:jobs_to_automate]
+        self.employed[to_automate_indices] = False
 
-        for idx in to_automate_indices:
-            self.workers[idx].employed = False
-
-        self.num_employed = sum(1 for w in self.workers if w.employed)
+        self.num_employed = int(np.count_nonzero(self.employed))
 
-        # Update non-AI firms' revenue based on new consumption
-        for firm in self.non_ai_firms:
-            firm.update(self.total_consumption)
+        # Non-AI firms' revenue proportional to consumption (demand)
+        self.nonai_revenue = GAMMA * self.total_consumption
+        total_nonai = NUM_NONAI * self.nonai_revenue
 
-        stimulus = self.government.update(
-            self.num_employed,
-            self.non_ai_firms,
-            self.workers
-        )
-        self.total_consumption += stimulus
+        # Government taxes wages and firm revenues, spends half as stimulus
+        wages = self.wages.sum(where=self.employed, dtype=np.float64)
+        self.tax_revenue = TAU * (wages + total_nonai)
+        self.total_consumption += 0.5 * self.tax_revenue
 
         # Record data for analysis
         self.data["Employment"].append(self.num_employed)
         self.data["Consumption"].append(self.total_consumption)
-        self.data["Tax Revenue"].append(self.government.tax_revenue)
-        self.data["AI Profit"].append(self.ai_firm.material_gain)
-        self.data["Non-AI Revenue"].append(
-            sum(f.revenue for f in self.non_ai_firms)
-        )
+        self.data["Tax Revenue"].append(self.tax_revenue)
+        self.data["AI Profit"].append(self.material_gain)
+        self.data["Non-AI Revenue"].append(total_nonai)
 
+    def data_arrays(self):
+        """Return the recorded series as NumPy arrays."""
+        return {key: np.asarray(values) for key, values in self.data.items()}
 
-def run_simulation():
-    """Run and visualize the economic simulation."""
-    economy = Economy()
 
+def _run_one(seed):
+    """Run a single replicate to completion and return its series."""
+    economy = Economy(seed=seed)
     for _ in range(NUM_STEPS):
         economy.step()
+    return economy.data_arrays()
 
-    data = economy.data
+
+def run_batch(n_replicates, seed=None, max_workers=None):
+    """
+    Run independent stochastic replicates in parallel processes.
+
+    Args:
+        n_replicates: Number of independent simulations
+        seed: Root seed from which per-replicate seeds are spawned
+        max_workers: Number of worker processes (defaults to CPU count)
+
+    Returns:
+        dict: Series name -> array of shape (n_replicates, NUM_STEPS + 1)
+    """
+    seeds = np.random.SeedSequence(seed).spawn(n_replicates)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_run_one, seeds))
+    return {
+        key: np.stack([r[key] for r in results]) if results
+        else np.zeros((0, NUM_STEPS + 1))
+        for key in SERIES
+    }
+
+
+def run_vectorized(n_replicates, seed=None):
+    """
+    Run independent replicates as one batched NumPy simulation.
+
+    Workers of all replicates are held in (n_replicates, INITIAL_JOBS)
+    arrays and every replicate advances together at each time step.
+
+    Args:
+        n_replicates: Number of independent simulations
+        seed: Seed for the shared random generator
+
+    Returns:
+        dict: Series name -> array of shape (n_replicates, NUM_STEPS + 1)
+    """
+    rng = np.random.default_rng(seed)
+    shape = (n_replicates, INITIAL_JOBS)
+    wages = rng.normal(INITIAL_WAGE_MEAN, INITIAL_WAGE_STD, shape)
+    wages = np.clip(wages, a_min=10, a_max=None)  # No negative wages
+    wages = wages.astype(np.float32)
+    employed = np.ones(shape, dtype=bool)
+    consumption = np.empty(shape, dtype=np.float32)
+
+    num_employed = np.full(n_replicates, INITIAL_JOBS)
+    material_gain = np.zeros(n_replicates)
+    total_consumption = BETA * wages.sum(axis=1, dtype=np.float64)
+    inv_initial_consumption = np.divide(
+        1.0,
+        total_consumption,
+        out=np.zeros(n_replicates),
+        where=total_consumption > 0
+    )
+
+    data = {key: np.zeros((n_replicates, NUM_STEPS + 1)) for key in SERIES}
+    data["Employment"][:, 0] = num_employed
+    data["Consumption"][:, 0] = total_consumption
+
+    for t in range(1, NUM_STEPS + 1):
+        # Update workers' consumption (C_t = β * W_t if employed)
+        np.multiply(wages, BETA, out=consumption)
+        consumption[~employed] = 0.0
+        total_consumption = consumption.sum(axis=1, dtype=np.float64)
+
+        # AI firms automate jobs with a stochastic rate per replicate
+        alpha = rng.normal(ALPHA_MEAN, ALPHA_STD, n_replicates).clip(min=0)
+        jobs_to_automate = (alpha * num_employed).astype(int)
+        raw_profit = jobs_to_automate * AI_PROFIT_PER_JOB
+        ratio = total_consumption * inv_initial_consumption
+        material_gain += raw_profit * np.maximum(0, 1 - EPSILON * (1 - ratio))
+
+        # First jobs_to_automate employed workers in each row lose their jobs
+        rank = np.cumsum(employed, axis=1)
+        employed &= rank > jobs_to_automate[:, None]
+        num_employed = employed.sum(axis=1)
+
+        total_nonai = NUM_NONAI * GAMMA * total_consumption
+        wages_employed = wages.sum(axis=1, where=employed, dtype=np.float64)
+        tax_revenue = TAU * (wages_employed + total_nonai)
+        total_consumption = total_consumption + 0.5 * tax_revenue
+
+        data["Employment"][:, t] = num_employed
+        data["Consumption"][:, t] = total_consumption
+        data["Tax Revenue"][:, t] = tax_revenue
+        data["AI Profit"][:, t] = material_gain
+        data["Non-AI Revenue"][:, t] = total_nonai
+
+    return data
+
+
+@njit(cache=True)
+def run_kernel(wages, alphas):
+    """
+    Run the whole simulation as one compiled loop.
+
+    Args:
+        wages: Array of worker wages
+        alphas: Pre-sampled, non-negative automation rate for each step
+
+    Returns:
+        ndarray: Shape (len(SERIES), len(alphas) + 1), rows in SERIES order
+    """
+    num_workers = wages.size
+    num_steps = alphas.size
+    series = np.zeros((len(SERIES), num_steps + 1))
+    employed = np.ones(num_workers, dtype=np.bool_)
+
+    total_consumption = 0.0
+    for i in range(num_workers):
+        total_consumption += BETA * wages[i]
+    inv_initial_consumption = (
+        1.0 / total_consumption if total_consumption > 0 else 0.0
+    )
+    num_employed = num_workers
+    material_gain = 0.0
+    series[0, 0] = num_employed
+    series[1, 0] = total_consumption
+
+    for t in range(num_steps):
+        # Consumption (C_t = β * W_t if employed)
+        total_consumption = 0.0
+        for i in range(num_workers):
+            if employed[i]:
+                total_consumption += BETA * wages[i]
+
+        # AI firm automates jobs, profit adjusted by consumption ratio
+        jobs_to_automate = int(alphas[t] * num_employed)
+        raw_profit = jobs_to_automate * AI_PROFIT_PER_JOB
+        ratio = total_consumption * inv_initial_consumption
+        material_gain += raw_profit * max(0.0, 1 - EPSILON * (1 - ratio))
+
+        # First jobs_to_automate employed workers lose their jobs, and the
+        # remaining wages are summed for taxation in the same pass
+        automated = 0
+        wages_employed = 0.0
+        for i in range(num_workers):
+            if employed[i]:
+                if automated < jobs_to_automate:
+                    employed[i] = False
+                    automated += 1
+                else:
+                    wages_employed += wages[i]
+        num_employed -= automated
+
+        total_nonai = NUM_NONAI * GAMMA * total_consumption
+        tax_revenue = TAU * (wages_employed + total_nonai)
+        total_consumption += 0.5 * tax_revenue
+
+        series[0, t + 1] = num_employed
+        series[1, t + 1] = total_consumption
+        series[2, t + 1] = tax_revenue
+        series[3, t + 1] = material_gain
+        series[4, t + 1] = total_nonai
+
+    return series
+
+
+def run_compiled(seed=None):
+    """
+    Run one simulation through the compiled run_kernel.
+
+    Draws wages and then every step's automation rate from a single
+    generator, in the same order as Economy.
+
+    Args:
+        seed: Seed for the random generator
+
+    Returns:
+        dict: Series name -> array of length NUM_STEPS + 1
+    """
+    rng = np.random.default_rng(seed)
+    wages = rng.normal(INITIAL_WAGE_MEAN, INITIAL_WAGE_STD, INITIAL_JOBS)
+    wages = np.clip(wages, a_min=10, a_max=None)  # No negative wages
+    alphas = rng.normal(ALPHA_MEAN, ALPHA_STD, NUM_STEPS).clip(min=0)
+    series = run_kernel(wages.astype(np.float32), alphas)
+    return dict(zip(SERIES, series))
+
+
+def run_simulation():
+    """Run and visualize the economic simulation."""
+    data = run_compiled()
     # Normalize for visualization purposes
     normalized = {
-        key: [v / max(values) if max(values) > 0 else 0 for v in values]
+        key: values / values.max() if values.max() > 0
+        else np.zeros_like(values)
         for key, values in data.items()
     }
 